@@ -7,24 +7,43 @@ A simplified system for monitoring competitors and generating reports without he
 import asyncio
 import aiohttp
 import sys
+import signal
 import sqlite3
 import json
 import hashlib
-from datetime import datetime, timedelta
+import codecs
+import heapq
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from io import BytesIO
 from dataclasses import dataclass
-from typing import List, Dict, Optional
+from operator import attrgetter
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from typing import Container, List, Dict, Optional, Tuple
 from urllib.parse import urljoin, urlparse
 import feedparser
-import schedule
-import time
 import logging
+import time
 from pathlib import Path
 import re
-from bs4 import BeautifulSoup
+from lxml import etree, html as lxml_html
+
+try:
+    import orjson  # Optional: faster JSON encoding and decoding
+except ImportError:
+    orjson = None
+try:
+    import aiodns  # Optional: asynchronous DNS lookups for aiohttp
+except ImportError:
+    aiodns = None
+try:
+    import uvloop  # Optional: faster event loop (not available on Windows)
+except ImportError:
+    uvloop = None
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-import requests
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -44,6 +63,42 @@ def convert_datetime(s):
 sqlite3.register_adapter(datetime, adapt_datetime)
 sqlite3.register_converter('timestamp', convert_datetime)
 
+# Upper bound on sources scraped concurrently during a collection cycle
+MAX_CONCURRENT_FETCHES = 10
+# Workers draining the source queue while monitoring
+COLLECTION_WORKERS = 8
+# Seconds to let in-flight source checks finish when shutting down
+SHUTDOWN_TIMEOUT = 10
+# Failing sources are retried after 30s, doubling per consecutive failure up to this many seconds
+MAX_SOURCE_BACKOFF = 3600
+
+# Maximum number of bytes read from a scraped web page
+MAX_PAGE_BYTES = 512 * 1024
+# Only the newest entries of each feed are considered
+MAX_FEED_ENTRIES = 15
+# Fallback container for page text: a <div> whose class list includes "content" or "main"
+_CONTENT_DIV_XPATH = etree.XPath(
+    "//div[contains(concat(' ', normalize-space(@class), ' '), ' content ')"
+    " or contains(concat(' ', normalize-space(@class), ' '), ' main ')]"
+)
+
+# Keyword extraction patterns
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_WORD_RE = re.compile(r'\b[a-zA-Z]{4,}\b')
+_STOPWORDS = frozenset(['this', 'that', 'with', 'have', 'they', 'been', 'said', 'from', 'were', 'will'])
+
+def _json_dumps(obj) -> str:
+    """Serialize obj to a JSON string, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+def _json_loads(data):
+    """Parse a JSON string or bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 @dataclass
 class DataSource:
     """Represents a data source to monitor"""
@@ -53,6 +108,9 @@ class DataSource:
     frequency: int = 24  # hours
     last_checked: Optional[datetime] = None
     is_active: bool = True
+    etag: Optional[str] = None  # HTTP validators from the last successful fetch
+    last_modified: Optional[str] = None
+    content_hash: Optional[str] = None  # BLAKE2b of the last body, for servers without validators
 
 @dataclass
 class MarketData:
@@ -72,274 +130,707 @@ class DatabaseManager:
     
     def __init__(self, db_path: str = "market_research.db"):
         self.db_path = db_path
+        # One long-lived connection in autocommit mode; writes open their own transactions
+        self._conn = sqlite3.connect(
+            db_path, detect_types=sqlite3.PARSE_DECLTYPES,
+            check_same_thread=False, isolation_level=None
+        )
         self.init_database()
+        
+        # IDs already stored for the current window, so re-scraped items skip the write entirely.
+        # Each maps to when it was remembered, so the set can be pruned to the window as it grows.
+        cutoff = datetime.now() - timedelta(days=7)
+        loaded_at = time.time()
+        self._seen_ids = {
+            row[0]: loaded_at
+            for row in self._conn.execute('SELECT id FROM market_data WHERE timestamp > ?', (cutoff,))
+        }
+    
+    @property
+    def seen_ids(self) -> Container[str]:
+        """IDs of items already stored for the current window"""
+        return self._seen_ids
+    
+    @contextmanager
+    def _transaction(self):
+        """Run the enclosed writes in a single IMMEDIATE transaction"""
+        cursor = self._conn.cursor()
+        cursor.execute('BEGIN IMMEDIATE')
+        try:
+            yield cursor
+        except Exception:
+            cursor.execute('ROLLBACK')
+            raise
+        cursor.execute('COMMIT')
     
     def init_database(self):
         """Initialize database tables"""
-        conn = sqlite3.connect(self.db_path, detect_types=sqlite3.PARSE_DECLTYPES)
-        cursor = conn.cursor()
-        
-        # Data sources table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS data_sources (
-                url TEXT PRIMARY KEY,
-                source_type TEXT NOT NULL,
-                company TEXT NOT NULL,
-                frequency INTEGER DEFAULT 24,
-                last_checked timestamp,
-                is_active BOOLEAN DEFAULT 1
-            )
-        ''')
-        
-        # Market data table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS market_data (
-                id TEXT PRIMARY KEY,
-                source TEXT NOT NULL,
-                company TEXT NOT NULL,
-                title TEXT NOT NULL,
-                content TEXT NOT NULL,
-                url TEXT NOT NULL,
-                timestamp timestamp NOT NULL,
-                data_type TEXT NOT NULL,
-                keywords TEXT
-            )
-        ''')
-        
-        # Reports table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS reports (
-                id TEXT PRIMARY KEY,
-                report_date TEXT NOT NULL,
-                content TEXT NOT NULL,
-                sources_cited TEXT NOT NULL,
-                created_at timestamp NOT NULL
-            )
-        ''')
-        
-        conn.commit()
-        conn.close()
+        cursor = self._conn.cursor()
+        
+        # WAL is persistent in the database file; in-memory databases can't use it
+        if self.db_path != ":memory:":
+            cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.execute('PRAGMA synchronous=NORMAL')
+        cursor.execute('PRAGMA busy_timeout=30000')
+        cursor.execute('PRAGMA temp_store=MEMORY')
+        cursor.execute('PRAGMA cache_size=-20000')
+        
+        with self._transaction() as cursor:
+            # Data sources table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS data_sources (
+                    url TEXT PRIMARY KEY,
+                    source_type TEXT NOT NULL,
+                    company TEXT NOT NULL,
+                    frequency INTEGER DEFAULT 24,
+                    last_checked timestamp,
+                    is_active BOOLEAN DEFAULT 1,
+                    etag TEXT,
+                    last_modified TEXT,
+                    content_hash TEXT
+                )
+            ''')
+            
+            # Databases created before conditional fetching lack the validator columns
+            columns = {row[1] for row in cursor.execute('PRAGMA table_info(data_sources)')}
+            for column in ('etag', 'last_modified', 'content_hash'):
+                if column not in columns:
+                    cursor.execute(f'ALTER TABLE data_sources ADD COLUMN {column} TEXT')
+            
+            # Market data table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS market_data (
+                    id TEXT PRIMARY KEY,
+                    source TEXT NOT NULL,
+                    company TEXT NOT NULL,
+                    title TEXT NOT NULL,
+                    content TEXT NOT NULL,
+                    url TEXT NOT NULL,
+                    timestamp timestamp NOT NULL,
+                    data_type TEXT NOT NULL,
+                    keywords TEXT
+                )
+            ''')
+            
+            # Recency scans and per-company lookups
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_md_ts ON market_data(timestamp)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_md_company_ts ON market_data(company, timestamp DESC)')
+            
+            # Keywords normalized out of market_data so they can be aggregated in SQL
+            has_keyword_table = cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'market_data_keywords'"
+            ).fetchone()
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS market_data_keywords (
+                    data_id TEXT NOT NULL,
+                    keyword TEXT NOT NULL,
+                    PRIMARY KEY (data_id, keyword)
+                )
+            ''')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_mdk_keyword ON market_data_keywords(keyword)')
+            
+            if not has_keyword_table:
+                # Backfill from the JSON keyword lists of existing rows
+                cursor.execute('''
+                    INSERT OR IGNORE INTO market_data_keywords (data_id, keyword)
+                    SELECT market_data.id, json_each.value
+                    FROM market_data, json_each(market_data.keywords)
+                    WHERE market_data.keywords IS NOT NULL
+                ''')
+            
+            # Reports table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS reports (
+                    id TEXT PRIMARY KEY,
+                    report_date TEXT NOT NULL,
+                    content TEXT NOT NULL,
+                    sources_cited TEXT NOT NULL,
+                    created_at timestamp NOT NULL
+                )
+            ''')
+    
+    def close(self):
+        """Close the database connection"""
+        self._conn.close()
     
     def add_data_source(self, source: DataSource):
-        """Add a new data source"""
-        conn = sqlite3.connect(self.db_path, detect_types=sqlite3.PARSE_DECLTYPES)
-        cursor = conn.cursor()
+        """Add a new data source, or refresh the configured fields of an existing one"""
+        # Re-registering on every start must keep last_checked and the HTTP validators
+        with self._transaction() as cursor:
+            cursor.execute('''
+                INSERT INTO data_sources 
+                (url, source_type, company, frequency, last_checked, is_active, etag, last_modified, content_hash)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(url) DO UPDATE SET
+                    source_type = excluded.source_type, company = excluded.company,
+                    frequency = excluded.frequency, is_active = excluded.is_active
+            ''', (
+                source.url, source.source_type, source.company,
+                source.frequency, source.last_checked, source.is_active,
+                source.etag, source.last_modified, source.content_hash
+            ))
+    
+    def update_last_checked_bulk(self, sources: List[DataSource]):
+        """Record check times and HTTP validators for many sources in one transaction"""
+        with self._transaction() as cursor:
+            cursor.executemany('''
+                UPDATE data_sources SET last_checked = ?, etag = ?, last_modified = ?, content_hash = ?
+                WHERE url = ?
+            ''', (
+                (source.last_checked, source.etag, source.last_modified, source.content_hash, source.url)
+                for source in sources
+            ))
+    
+    def get_active_sources(self) -> List[DataSource]:
+        """Get every active source"""
+        cursor = self._conn.cursor()
         
         cursor.execute('''
-            INSERT OR REPLACE INTO data_sources 
-            (url, source_type, company, frequency, last_checked, is_active)
-            VALUES (?, ?, ?, ?, ?, ?)
-        ''', (
-            source.url, source.source_type, source.company,
-            source.frequency, source.last_checked, source.is_active
-        ))
+            SELECT url, source_type, company, frequency, last_checked, is_active,
+                   etag, last_modified, content_hash
+            FROM data_sources 
+            WHERE is_active = 1
+        ''')
         
-        conn.commit()
-        conn.close()
+        return [
+            DataSource(
+                url=url, source_type=source_type, company=company,
+                frequency=frequency, last_checked=last_checked, is_active=bool(is_active),
+                etag=etag, last_modified=last_modified, content_hash=content_hash
+            )
+            for (url, source_type, company, frequency, last_checked, is_active,
+                 etag, last_modified, content_hash) in cursor
+        ]
     
     def get_sources_to_check(self) -> List[DataSource]:
         """Get sources that need to be checked"""
-        conn = sqlite3.connect(self.db_path, detect_types=sqlite3.PARSE_DECLTYPES)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT * FROM data_sources 
-            WHERE is_active = 1 AND (
-                last_checked IS NULL OR 
-                datetime(last_checked) < datetime('now', '-' || frequency || ' hours')
-            )
-        ''')
+        # Compare against one cutoff per frequency, on the same local clock last_checked is written with
+        now = datetime.now()
+        cutoffs = {}
         
         sources = []
-        for row in cursor.fetchall():
-            last_checked = row[4] if row[4] else None
-            sources.append(DataSource(
-                url=row[0], source_type=row[1], company=row[2],
-                frequency=row[3], last_checked=last_checked, is_active=bool(row[5])
-            ))
+        for source in self.get_active_sources():
+            if source.frequency not in cutoffs:
+                cutoffs[source.frequency] = now - timedelta(hours=source.frequency)
+            if source.last_checked and source.last_checked >= cutoffs[source.frequency]:
+                continue
+            sources.append(source)
         
-        conn.close()
         return sources
     
     def store_market_data(self, data: MarketData):
         """Store market data"""
-        conn = sqlite3.connect(self.db_path, detect_types=sqlite3.PARSE_DECLTYPES)
-        cursor = conn.cursor()
+        self.store_market_data_bulk([data])
+    
+    def store_market_data_bulk(self, items: List[MarketData]):
+        """Store many market data items in a single transaction, skipping ones already stored"""
+        new_items = {}
+        for data in items:
+            if data.id not in self._seen_ids:
+                new_items.setdefault(data.id, data)
+        
+        if not new_items:
+            return
         
-        keywords_json = json.dumps(data.keywords) if data.keywords else None
+        rows = (
+            (
+                data.id, data.source, data.company, data.title, data.content,
+                data.url, data.timestamp, data.data_type,
+                _json_dumps(data.keywords) if data.keywords else None
+            )
+            for data in new_items.values()
+        )
         
-        cursor.execute('''
-            INSERT OR REPLACE INTO market_data
-            (id, source, company, title, content, url, timestamp, data_type, keywords)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            data.id, data.source, data.company, data.title, data.content,
-            data.url, data.timestamp, data.data_type, keywords_json
-        ))
+        with self._transaction() as cursor:
+            cursor.executemany('''
+                INSERT OR IGNORE INTO market_data
+                (id, source, company, title, content, url, timestamp, data_type, keywords)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', rows)
+            cursor.executemany(
+                'INSERT OR IGNORE INTO market_data_keywords (data_id, keyword) VALUES (?, ?)',
+                ((data.id, keyword) for data in new_items.values() for keyword in (data.keywords or []))
+            )
         
-        conn.commit()
-        conn.close()
+        now = time.time()
+        self._seen_ids.update(dict.fromkeys(new_items, now))
+        self._prune_seen_ids(now)
+    
+    def _prune_seen_ids(self, now: float):
+        """Forget IDs remembered longer ago than the 7-day window"""
+        # Pruned in place, since scrapers hold a reference to this mapping
+        cutoff = now - 7 * 24 * 3600
+        expired = [data_id for data_id, seen_at in self._seen_ids.items() if seen_at < cutoff]
+        for data_id in expired:
+            del self._seen_ids[data_id]
     
     def get_recent_data(self, days: int = 7) -> List[MarketData]:
         """Get market data from the last N days"""
-        conn = sqlite3.connect(self.db_path, detect_types=sqlite3.PARSE_DECLTYPES)
-        cursor = conn.cursor()
+        cursor = self._conn.cursor()
+        cutoff = datetime.now() - timedelta(days=days)
         
+        # Timestamps are stored as ISO strings, so a plain comparison can use idx_md_ts
         cursor.execute('''
-            SELECT * FROM market_data 
-            WHERE datetime(timestamp) > datetime('now', '-' || ? || ' days')
+            SELECT id, source, company, title, content, url, timestamp, data_type, keywords
+            FROM market_data 
+            WHERE timestamp > ?
             ORDER BY timestamp DESC
-        ''', (days,))
-        
-        data_list = []
-        for row in cursor.fetchall():
-            keywords = json.loads(row[8]) if row[8] else []
-            
-            data_list.append(MarketData(
-                id=row[0], source=row[1], company=row[2], title=row[3],
-                content=row[4], url=row[5], 
-                timestamp=row[6],
-                data_type=row[7], keywords=keywords
+        ''', (cutoff,))
+        
+        # Build items straight off the cursor rather than from a fetchall() copy
+        return [
+            MarketData(
+                id=id_, source=source, company=company, title=title,
+                content=content, url=url, timestamp=timestamp,
+                data_type=data_type, keywords=_json_loads(keywords) if keywords else []
+            )
+            for id_, source, company, title, content, url, timestamp, data_type, keywords in cursor
+        ]
+    
+    def top_keywords(self, days: int = 7, limit: int = 15) -> List[Tuple[str, int]]:
+        """Get the most frequent keywords from the last N days with their counts"""
+        cutoff = datetime.now() - timedelta(days=days)
+        
+        cursor = self._conn.execute('''
+            SELECT k.keyword, COUNT(*) AS mentions
+            FROM market_data m
+            JOIN market_data_keywords k ON k.data_id = m.id
+            WHERE m.timestamp > ?
+            GROUP BY k.keyword
+            ORDER BY mentions DESC, k.keyword
+            LIMIT ?
+        ''', (cutoff, limit))
+        
+        return cursor.fetchall()
+    
+    def store_report(self, report_id: str, report: Dict):
+        """Store a generated report"""
+        with self._transaction() as cursor:
+            cursor.execute('''
+                INSERT INTO reports (id, report_date, content, sources_cited, created_at)
+                VALUES (?, ?, ?, ?, ?)
+            ''', (
+                report_id, datetime.now().strftime('%Y-%m-%d'),
+                report['content'], _json_dumps(report['sources_cited']),
+                datetime.now()
             ))
-        
-        conn.close()
-        return data_list
+    
+    def optimize(self):
+        """Let SQLite refresh query planner statistics"""
+        self._conn.execute('PRAGMA optimize')
+
+class CacheStore:
+    """On-disk cache of fetched page and feed bodies"""
+    
+    def __init__(self, db_path: str = "scrape_cache.db"):
+        self.db_path = db_path
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        if db_path != ":memory:":
+            self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS page_cache (
+                url TEXT PRIMARY KEY,
+                fetched_at INTEGER NOT NULL,
+                etag TEXT,
+                body BLOB NOT NULL
+            )
+        ''')
+    
+    def get(self, url: str, ttl: float) -> Optional[bytes]:
+        """Get the cached body for url if it was fetched less than ttl seconds ago"""
+        row = self._conn.execute(
+            'SELECT body FROM page_cache WHERE url = ? AND fetched_at > ?', (url, time.time() - ttl)
+        ).fetchone()
+        return row[0] if row else None
+    
+    def put(self, url: str, body: bytes, etag: Optional[str] = None):
+        """Cache a freshly fetched body"""
+        self._conn.execute(
+            'INSERT OR REPLACE INTO page_cache (url, fetched_at, etag, body) VALUES (?, ?, ?, ?)',
+            (url, int(time.time()), etag, body)
+        )
+    
+    def prune(self, max_age: float):
+        """Drop bodies fetched more than max_age seconds ago, including those of removed sources"""
+        self._conn.execute('DELETE FROM page_cache WHERE fetched_at <= ?', (time.time() - max_age,))
+    
+    def close(self):
+        """Close the cache database"""
+        self._conn.close()
 
 class WebScraper:
     """Handles web scraping operations"""
     
-    def __init__(self):
-        self.session = None
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+    }
     
-    async def __aenter__(self):
-        # Use default resolver to avoid aiodns issues
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None,
+                 cache: Optional['CacheStore'] = None, cache_ttl: float = 0,
+                 known_ids: Container[str] = ()):
+        # A session passed in is shared with the caller, who is responsible for closing it
+        self.session = session
+        self._owns_session = session is None
+        # Fetched bodies younger than cache_ttl seconds are served from the cache
+        self.cache = cache
+        self.cache_ttl = cache_ttl
+        # Items with these IDs are already stored, so they are dropped before keyword extraction
+        self.known_ids = known_ids
+    
+    @classmethod
+    def create_session(cls) -> aiohttp.ClientSession:
+        """Create a pooled HTTP session configured for scraping"""
+        # Resolve through c-ares when aiodns is installed, otherwise getaddrinfo in a thread pool
         connector = aiohttp.TCPConnector(
+            resolver=aiohttp.AsyncResolver() if aiodns is not None else None,
             ssl=False,  # Disable SSL verification for simplicity
-            use_dns_cache=False  # Disable DNS cache
+            use_dns_cache=True,
+            ttl_dns_cache=300,  # Resolve each host at most every 5 minutes
+            limit=100,
+            limit_per_host=4,  # Be polite to any single site
+            enable_cleanup_closed=True
         )
-        timeout = aiohttp.ClientTimeout(total=30)
-        self.session = aiohttp.ClientSession(headers=self.headers, connector=connector, timeout=timeout)
+        # Cap how long a slow or dead site can hold up a fetch
+        timeout = aiohttp.ClientTimeout(total=15, connect=5)
+        return aiohttp.ClientSession(headers=cls.headers, connector=connector, timeout=timeout)
+    
+    async def __aenter__(self):
+        if self._owns_session:
+            self.session = self.create_session()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
+        if self._owns_session and self.session:
             await self.session.close()
     
+    def _conditional_headers(self, source: Optional[DataSource]) -> Dict[str, str]:
+        """Build conditional request headers from a source's stored validators"""
+        headers = {}
+        if source and source.etag:
+            headers['If-None-Match'] = source.etag
+        if source and source.last_modified:
+            headers['If-Modified-Since'] = source.last_modified
+        return headers
+    
+    def _body_unchanged(self, source: Optional[DataSource], body_hash: str) -> bool:
+        """Whether a body is byte-identical to the one seen on the source's last fetch"""
+        return bool(source and source.content_hash == body_hash)
+    
+    def _remember_validators(self, source: Optional[DataSource], headers, body_hash: str):
+        """Keep the response validators and body hash so the next fetch can be skipped"""
+        if source:
+            # Cached bodies carry no headers; keep the validators from the last real response
+            if headers is not None:
+                source.etag = headers.get('ETag')
+                source.last_modified = headers.get('Last-Modified')
+            source.content_hash = body_hash
+    
     def extract_keywords(self, text: str) -> List[str]:
         """Simple keyword extraction using word frequency"""
         # Remove HTML and normalize text
-        text = re.sub(r'<[^>]+>', '', text.lower())
-        words = re.findall(r'\b[a-zA-Z]{4,}\b', text)
+        text = _HTML_TAG_RE.sub('', text.lower())
+        words = _WORD_RE.findall(text)
         
         # Count word frequency
-        word_count = {}
-        for word in words:
-            if word not in ['this', 'that', 'with', 'have', 'they', 'been', 'said', 'from', 'they', 'were', 'will']:
-                word_count[word] = word_count.get(word, 0) + 1
+        word_count = Counter(word for word in words if word not in _STOPWORDS)
         
         # Return top 10 most frequent words
-        return [word for word, count in sorted(word_count.items(), key=lambda x: x[1], reverse=True)[:10]]
+        return [word for word, count in word_count.most_common(10)]
+    
+    async def _fetch_body(self, url: str, source: Optional[DataSource] = None,
+                          max_bytes: Optional[int] = None, html_only: bool = False):
+        """Fetch a body as (bytes, headers, charset), or None when there is nothing new to parse
+        
+        Bodies served from the page cache come back without headers or charset.
+        """
+        if self.cache:
+            ttl = self.cache_ttl
+            if source:
+                ttl = min(ttl, source.frequency * 3600)
+            cached = self.cache.get(url, ttl)
+            if cached is not None:
+                return cached, None, None
+        
+        async with self.session.get(url, headers=self._conditional_headers(source)) as response:
+            if response.status == 304:
+                logger.info(f"Not modified since last check: {url}")
+                return None
+            
+            if response.status >= 400:
+                # Raised so the caller can count it as a failure and back off
+                response.raise_for_status()
+            
+            if response.status != 200:
+                logger.warning(f"HTTP {response.status} for {url}")
+                return None
+            
+            content_type = response.headers.get('Content-Type', '')
+            if html_only and content_type and 'html' not in content_type:
+                logger.info(f"Skipping non-HTML content ({content_type}) from {url}")
+                return None
+            
+            if max_bytes is None:
+                raw = await response.read()
+            else:
+                # Only the start of the body is needed, so don't buffer huge documents
+                raw = bytearray()
+                while len(raw) < max_bytes:
+                    chunk = await response.content.read(max_bytes - len(raw))
+                    if not chunk:
+                        break
+                    raw += chunk
+                raw = bytes(raw)
+        
+        if self.cache:
+            self.cache.put(url, raw, response.headers.get('ETag'))
+        return raw, response.headers, response.charset
     
-    async def scrape_website(self, url: str, company: str) -> List[MarketData]:
+    @staticmethod
+    def _parse_html(raw: bytes, charset: Optional[str] = None):
+        """Parse an HTML body with lxml, returning the root element or None for an empty document
+        
+        Without a charset (e.g. from the page cache) a body that decodes as UTF-8 is read as
+        UTF-8; anything else is left to lxml, which sniffs the document's own declaration.
+        """
+        if charset is None:
+            try:
+                # Incremental decoding tolerates a character cut off by the size limit
+                codecs.getincrementaldecoder('utf-8')().decode(raw)
+                charset = 'utf-8'
+            except UnicodeDecodeError:
+                pass
+        try:
+            parser = lxml_html.HTMLParser(encoding=charset, remove_comments=True)
+        except LookupError:
+            parser = lxml_html.HTMLParser(remove_comments=True)
+        return etree.fromstring(raw, parser)
+    
+    async def scrape_website(self, url: str, company: str,
+                             source: Optional[DataSource] = None) -> List[MarketData]:
         """Scrape a website for relevant content"""
         try:
-            async with self.session.get(url) as response:
-                if response.status != 200:
-                    logger.warning(f"HTTP {response.status} for {url}")
-                    return []
-                
-                html = await response.text()
-                soup = BeautifulSoup(html, 'html.parser')
-                
-                # Remove script and style elements
-                for script in soup(["script", "style", "nav", "footer", "header"]):
-                    script.decompose()
-                
-                # Extract main content
-                main_content = soup.find('main') or soup.find('article') or soup.find('div', class_=['content', 'main'])
-                
-                if main_content:
-                    content_tags = main_content.find_all(['p', 'h1', 'h2', 'h3', 'h4'])
-                else:
-                    content_tags = soup.find_all(['p', 'h1', 'h2', 'h3'])
-                
-                content = ' '.join([tag.get_text(strip=True) for tag in content_tags])
-                
-                if len(content) < 100:  # Skip if too little content
-                    logger.info(f"Insufficient content from {url}")
-                    return []
-                
-                # Create data entry
-                data_id = hashlib.md5(f"{url}_{content[:100]}".encode()).hexdigest()
-                keywords = self.extract_keywords(content)
-                
-                return [MarketData(
-                    id=data_id,
-                    source=url,
-                    company=company,
-                    title=soup.title.string if soup.title else "Website Content",
-                    content=content[:3000],  # Limit content length
-                    url=url,
-                    timestamp=datetime.now(),
-                    data_type="website",
-                    keywords=keywords
-                )]
-                
+            fetched = await self._fetch_body(url, source, max_bytes=MAX_PAGE_BYTES, html_only=True)
+            if fetched is None:
+                return []
+            raw, response_headers, charset = fetched
+            
+            body_hash = hashlib.blake2b(raw, digest_size=16).hexdigest()
+            if self._body_unchanged(source, body_hash):
+                logger.info(f"Content unchanged since last check: {url}")
+                return []
+            
+            root = self._parse_html(raw, charset)
+            if root is None:
+                logger.info(f"Insufficient content from {url}")
+                return []
+            
+            # Remove script and style elements
+            for element in list(root.iter("script", "style", "nav", "footer", "header")):
+                element.drop_tree()
+            
+            # Extract main content
+            main_content = root.find('.//main')
+            if main_content is None:
+                main_content = root.find('.//article')
+            if main_content is None:
+                content_divs = _CONTENT_DIV_XPATH(root)
+                main_content = content_divs[0] if content_divs else None
+            
+            if main_content is not None:
+                content_tags = main_content.iter('p', 'h1', 'h2', 'h3', 'h4')
+            else:
+                content_tags = root.iter('p', 'h1', 'h2', 'h3')
+            
+            # Join each tag's stripped text fragments, as BeautifulSoup's get_text(strip=True) did
+            content = ' '.join(''.join(text.strip() for text in tag.itertext()) for tag in content_tags)
+            title_tag = root.find('.//title')
+            
+            self._remember_validators(source, response_headers, body_hash)
+            
+            if len(content) < 100:  # Skip if too little content
+                logger.info(f"Insufficient content from {url}")
+                return []
+            
+            # Create data entry
+            data_id = hashlib.blake2b(f"{url}_{content[:100]}".encode(), digest_size=16).hexdigest()
+            if data_id in self.known_ids:
+                logger.info(f"Content already stored from {url}")
+                return []
+            keywords = self.extract_keywords(content)
+            
+            return [MarketData(
+                id=data_id,
+                source=url,
+                company=company,
+                title=title_tag.text if title_tag is not None else "Website Content",
+                content=content[:3000],  # Limit content length
+                url=url,
+                timestamp=datetime.now(),
+                data_type="website",
+                keywords=keywords
+            )]
+            
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            raise
         except Exception as e:
             logger.error(f"Error scraping {url}: {e}")
             return []
     
-    async def scrape_rss_feed(self, url: str, company: str) -> List[MarketData]:
-        """Scrape RSS feed for new articles"""
+    @staticmethod
+    def _feed_date(value: Optional[str]) -> Optional[datetime]:
+        """Parse an RFC 822 (RSS) or ISO 8601 (Atom) date into naive UTC"""
+        if not value:
+            return None
+        value = value.strip()
+        try:
+            parsed = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            parsed = None
+        if parsed is None:
+            try:
+                parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+            except ValueError:
+                return None
+        if parsed.tzinfo is not None:
+            parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+        return parsed.replace(microsecond=0)
+    
+    @classmethod
+    def parse_feed(cls, raw: bytes) -> List[Tuple[str, str, str, Optional[datetime]]]:
+        """Parse the newest feed entries into (title, link, content, published) tuples
+        
+        RSS and Atom are streamed through lxml; anything it rejects (e.g. HTML entities
+        in badly formed feeds) goes through the more forgiving feedparser instead.
+        """
+        try:
+            return cls._parse_feed_lxml(raw)
+        except etree.XMLSyntaxError:
+            return cls._parse_feed_fallback(raw)
+    
+    @classmethod
+    def _parse_feed_lxml(cls, raw: bytes) -> List[Tuple[str, str, str, Optional[datetime]]]:
+        entries = []
+        parser = etree.iterparse(BytesIO(raw), events=('end',), resolve_entities=False, no_network=True)
+        for _, elem in parser:
+            if not isinstance(elem.tag, str) or etree.QName(elem).localname not in ('item', 'entry'):
+                continue
+            
+            fields = {}
+            link = ''
+            for child in elem:
+                if not isinstance(child.tag, str):
+                    continue
+                name = etree.QName(child).localname
+                if name == 'link' and child.get('href') is not None:
+                    # Atom links live in attributes; prefer the alternate (article) link
+                    if child.get('rel', 'alternate') == 'alternate' or not link:
+                        link = child.get('href')
+                elif len(child):
+                    # Inline XHTML content
+                    fields.setdefault(name, ''.join(etree.tostring(c, encoding='unicode') for c in child))
+                else:
+                    fields.setdefault(name, child.text or '')
+            
+            content = fields.get('summary') or fields.get('description') or fields.get('content') \
+                or fields.get('encoded') or ''
+            published = cls._feed_date(fields.get('pubDate') or fields.get('published')) \
+                or cls._feed_date(fields.get('updated') or fields.get('date'))
+            entries.append((fields.get('title', '').strip(), (link or fields.get('link', '')).strip(),
+                            content.strip(), published))
+            
+            # Drop finished entries so memory stays flat however long the feed is
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+            
+            if len(entries) >= MAX_FEED_ENTRIES:
+                break
+        return entries
+    
+    @staticmethod
+    def _parse_feed_fallback(raw: bytes) -> List[Tuple[str, str, str, Optional[datetime]]]:
+        entries = []
+        for entry in feedparser.parse(raw).entries[:MAX_FEED_ENTRIES]:
+            published = None
+            if hasattr(entry, 'published_parsed') and entry.published_parsed:
+                published = datetime(*entry.published_parsed[:6])
+            elif hasattr(entry, 'updated_parsed') and entry.updated_parsed:
+                published = datetime(*entry.updated_parsed[:6])
+            
+            content = ""
+            if hasattr(entry, 'summary'):
+                content = entry.summary
+            elif hasattr(entry, 'description'):
+                content = entry.description
+            elif hasattr(entry, 'content'):
+                content = entry.content[0].value if entry.content else ""
+            
+            entries.append((entry.get('title', ''), entry.get('link', ''), content, published))
+        return entries
+    
+    async def scrape_rss_feed(self, url: str, company: str,
+                              source: Optional[DataSource] = None,
+                              filter_keywords: Optional[List[str]] = None) -> List[MarketData]:
+        """Scrape RSS feed for new articles, optionally keeping only entries mentioning a keyword"""
+        # One alternation regex scans each entry once instead of once per keyword
+        keyword_re = None
+        if filter_keywords:
+            keyword_re = re.compile('|'.join(re.escape(keyword.lower()) for keyword in filter_keywords))
+        
         try:
-            # Use requests for RSS since feedparser doesn't work well with aiohttp
-            response = requests.get(url, headers=self.headers, timeout=30)
-            feed = feedparser.parse(response.content)
+            fetched = await self._fetch_body(url, source)
+            if fetched is None:
+                return []
+            raw, response_headers, _ = fetched
+            
+            # Servers that ignore conditional requests often still return identical bytes
+            body_hash = hashlib.blake2b(raw, digest_size=16).hexdigest()
+            if self._body_unchanged(source, body_hash):
+                logger.info(f"Feed unchanged since last check: {url}")
+                return []
+            
+            # Parse off the event loop so other fetches keep going
+            entries = await asyncio.get_running_loop().run_in_executor(None, self.parse_feed, raw)
             
             data_list = []
             
-            for entry in feed.entries[:15]:  # Limit to 15 most recent
+            for title, link, content, published in entries:
                 # Check if entry is from last week
-                entry_date = datetime.now()
-                if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                    entry_date = datetime(*entry.published_parsed[:6])
-                elif hasattr(entry, 'updated_parsed') and entry.updated_parsed:
-                    entry_date = datetime(*entry.updated_parsed[:6])
+                entry_date = published or datetime.now()
                 
                 if entry_date < datetime.now() - timedelta(days=7):
                     continue
                 
-                content = ""
-                if hasattr(entry, 'summary'):
-                    content = entry.summary
-                elif hasattr(entry, 'description'):
-                    content = entry.description
-                elif hasattr(entry, 'content'):
-                    content = entry.content[0].value if entry.content else ""
-                
                 if len(content) < 50:
                     continue
                 
-                data_id = hashlib.md5(f"{entry.link}_{entry.title}".encode()).hexdigest()
+                # Drop non-matching entries before paying for hashing and keyword extraction
+                if keyword_re and not keyword_re.search(f"{title} {content}".lower()):
+                    continue
+                
+                data_id = hashlib.blake2b(f"{link}_{title}".encode(), digest_size=16).hexdigest()
+                if data_id in self.known_ids:
+                    continue
                 keywords = self.extract_keywords(content)
                 
                 data_list.append(MarketData(
                     id=data_id,
                     source=url,
                     company=company,
-                    title=entry.title,
+                    title=title,
                     content=content[:2000],
-                    url=entry.link,
+                    url=link,
                     timestamp=entry_date,
                     data_type="rss",
                     keywords=keywords
                 ))
             
+            self._remember_validators(source, response_headers, body_hash)
             return data_list
             
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            raise
         except Exception as e:
             logger.error(f"Error scraping RSS {url}: {e}")
             return []
@@ -351,19 +842,25 @@ class NewsAggregator:
         self.news_api_key = news_api_key
         self.headers = {'User-Agent': 'Mozilla/5.0 (compatible; MarketResearchBot/1.0)'}
     
-    async def get_industry_news(self, keywords: List[str]) -> List[MarketData]:
+    async def get_industry_news(self, keywords: List[str],
+                                scraper: Optional[WebScraper] = None) -> List[MarketData]:
         """Get industry news using News API or free news sources"""
+        if scraper is None:
+            async with WebScraper() as scraper:
+                return await self.get_industry_news(keywords, scraper)
+        
         news_data = []
         
         if self.news_api_key:
-            news_data.extend(await self._get_news_api_data(keywords))
+            news_data.extend(await self._get_news_api_data(keywords, scraper.session))
         
         # Add free news sources
-        news_data.extend(await self._get_free_news_sources(keywords))
+        news_data.extend(await self._get_free_news_sources(keywords, scraper))
         
         return news_data
     
-    async def _get_news_api_data(self, keywords: List[str]) -> List[MarketData]:
+    async def _get_news_api_data(self, keywords: List[str],
+                                 session: aiohttp.ClientSession) -> List[MarketData]:
         """Get news from News API"""
         try:
             query = " OR ".join(keywords[:3])  # Limit query length
@@ -376,44 +873,43 @@ class NewsAggregator:
                 'language': 'en'
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params) as response:
-                    if response.status != 200:
-                        logger.error(f"News API returned status {response.status}")
-                        return []
-                    
-                    data = await response.json()
+            async with session.get(url, params=params, headers=self.headers) as response:
+                if response.status != 200:
+                    logger.error(f"News API returned status {response.status}")
+                    return []
+                
+                data = await response.json()
+                
+                news_data = []
+                for article in data.get('articles', []):
+                    # Skip old articles
+                    article_date = datetime.fromisoformat(article['publishedAt'].replace('Z', '+00:00'))
+                    if article_date < datetime.now().replace(tzinfo=article_date.tzinfo) - timedelta(days=7):
+                        continue
                     
-                    news_data = []
-                    for article in data.get('articles', []):
-                        # Skip old articles
-                        article_date = datetime.fromisoformat(article['publishedAt'].replace('Z', '+00:00'))
-                        if article_date < datetime.now().replace(tzinfo=article_date.tzinfo) - timedelta(days=7):
-                            continue
-                        
-                        if not article.get('description'):
-                            continue
-                        
-                        data_id = hashlib.md5(article['url'].encode()).hexdigest()
-                        
-                        news_data.append(MarketData(
-                            id=data_id,
-                            source=article['source']['name'],
-                            company="Industry",
-                            title=article['title'],
-                            content=article['description'],
-                            url=article['url'],
-                            timestamp=article_date.replace(tzinfo=None),
-                            data_type="news"
-                        ))
+                    if not article.get('description'):
+                        continue
                     
-                    return news_data
+                    data_id = hashlib.blake2b(article['url'].encode(), digest_size=16).hexdigest()
                     
+                    news_data.append(MarketData(
+                        id=data_id,
+                        source=article['source']['name'],
+                        company="Industry",
+                        title=article['title'],
+                        content=article['description'],
+                        url=article['url'],
+                        timestamp=article_date.replace(tzinfo=None),
+                        data_type="news"
+                    ))
+                
+                return news_data
+                
         except Exception as e:
             logger.error(f"Error fetching industry news from News API: {e}")
             return []
     
-    async def _get_free_news_sources(self, keywords: List[str]) -> List[MarketData]:
+    async def _get_free_news_sources(self, keywords: List[str], scraper: WebScraper) -> List[MarketData]:
         """Get news from free RSS sources"""
         free_sources = [
             "https://techcrunch.com/feed/",
@@ -422,41 +918,54 @@ class NewsAggregator:
         ]
         
         news_data = []
-        scraper = WebScraper()
+        if not keywords:
+            return news_data
         
-        async with scraper:
-            for source_url in free_sources:
-                try:
-                    source_data = await scraper.scrape_rss_feed(source_url, "Industry")
-                    # Filter by keywords
-                    for item in source_data:
-                        item_text = f"{item.title} {item.content}".lower()
-                        if any(keyword.lower() in item_text for keyword in keywords):
-                            news_data.append(item)
-                except Exception as e:
-                    logger.error(f"Error getting news from {source_url}: {e}")
+        results = await asyncio.gather(
+            *(scraper.scrape_rss_feed(source_url, "Industry", filter_keywords=keywords)
+              for source_url in free_sources),
+            return_exceptions=True
+        )
+        
+        for source_url, source_data in zip(free_sources, results):
+            if isinstance(source_data, Exception):
+                logger.error(f"Error getting news from {source_url}: {source_data}")
+                continue
+            
+            news_data.extend(source_data)
         
         return news_data[:20]  # Limit results
 
 class SimpleReportGenerator:
     """Generates market analysis reports using simple text processing"""
     
-    def generate_weekly_report(self, data_list: List[MarketData]) -> Dict:
-        """Generate a comprehensive weekly report"""
-        
-        # Organize data by company
-        company_data = {}
+    def generate_weekly_report(self, data_list: List[MarketData],
+                               top_keywords: Optional[List[Tuple[str, int]]] = None) -> Dict:
+        """Generate a comprehensive weekly report
+        
+        top_keywords may be supplied pre-aggregated (e.g. by DatabaseManager.top_keywords);
+        otherwise they are counted from data_list.
+        """
+        
+        # Single pass: organize data by company and tally report-wide counts
+        company_data = defaultdict(list)
+        type_counts = Counter()
+        keyword_freq = Counter()
         for data in data_list:
-            if data.company not in company_data:
-                company_data[data.company] = []
             company_data[data.company].append(data)
+            type_counts[data.data_type] += 1
+            if top_keywords is None and data.keywords:
+                keyword_freq.update(data.keywords)
+        
+        if top_keywords is None:
+            top_keywords = keyword_freq.most_common(15)
         
         # Generate report sections
         sections = []
         sources_cited = set()
         
         # Executive Summary
-        summary_content = self._generate_executive_summary(data_list)
+        summary_content = self._generate_executive_summary(data_list, company_data, type_counts)
         sections.append(("Executive Summary", summary_content))
         
         # Company-specific analysis
@@ -480,12 +989,13 @@ class SimpleReportGenerator:
                 sources_cited.add(item.url)
         
         # Top Keywords Analysis
-        keyword_analysis = self._analyze_keywords(data_list)
+        keyword_analysis = self._analyze_keywords(top_keywords)
         sections.append(("Key Topics This Week", keyword_analysis))
         
         # Compile final report
-        report_content = f"# Market Research Report - {datetime.now().strftime('%B %d, %Y')}\n\n"
-        report_content += "\n\n".join([f"## {title}\n\n{content}" for title, content in sections])
+        report_parts = [f"# Market Research Report - {datetime.now().strftime('%B %d, %Y')}"]
+        report_parts.extend(f"## {title}\n\n{content}" for title, content in sections)
+        report_content = "\n\n".join(report_parts)
         
         return {
             "content": report_content,
@@ -494,111 +1004,91 @@ class SimpleReportGenerator:
             "data_points": len(data_list)
         }
     
-    def _generate_executive_summary(self, data_list: List[MarketData]) -> str:
+    def _generate_executive_summary(self, data_list: List[MarketData],
+                                    company_data: Dict[str, List[MarketData]],
+                                    type_counts: Counter) -> str:
         """Generate executive summary using simple analysis"""
         total_items = len(data_list)
-        companies = set(item.company for item in data_list if item.company != "Industry")
+        companies = [company for company in company_data if company != "Industry"]
         
-        # Count by data type
-        type_counts = {}
-        for item in data_list:
-            type_counts[item.data_type] = type_counts.get(item.data_type, 0) + 1
-        
-        summary = f"This week's market research covered {total_items} data points from {len(companies)} companies and industry sources.\n\n"
+        lines = [
+            f"This week's market research covered {total_items} data points from {len(companies)} companies and industry sources.",
+            ""
+        ]
         
         if type_counts:
-            summary += "Data sources breakdown:\n"
+            lines.append("Data sources breakdown:")
             for data_type, count in type_counts.items():
-                summary += f"- {data_type.title()}: {count} items\n"
-            summary += "\n"
+                lines.append(f"- {data_type.title()}: {count} items")
+            lines.append("")
         
         # Recent activity summary
-        recent_items = sorted(data_list, key=lambda x: x.timestamp, reverse=True)[:5]
-        summary += "Most recent developments:\n"
+        recent_items = heapq.nlargest(5, data_list, key=attrgetter('timestamp'))
+        lines.append("Most recent developments:")
         for item in recent_items:
-            summary += f"- **{item.company}**: {item.title[:100]}{'...' if len(item.title) > 100 else ''}\n"
+            lines.append(f"- **{item.company}**: {item.title[:100]}{'...' if len(item.title) > 100 else ''}")
         
-        return summary
+        return "\n".join(lines) + "\n"
     
     def _analyze_company_data(self, company: str, data_items: List[MarketData]) -> str:
         """Analyze data for a specific company"""
-        analysis = f"**Activity Summary**: {len(data_items)} items tracked this week.\n\n"
+        lines = [f"**Activity Summary**: {len(data_items)} items tracked this week.", ""]
         
         # Recent items
-        recent_items = sorted(data_items, key=lambda x: x.timestamp, reverse=True)[:5]
+        recent_items = heapq.nlargest(5, data_items, key=attrgetter('timestamp'))
         
-        analysis += "**Recent Updates:**\n"
+        lines.append("**Recent Updates:**")
         for item in recent_items:
             date_str = item.timestamp.strftime('%Y-%m-%d')
-            analysis += f"- **{date_str}**: {item.title}\n"
+            lines.append(f"- **{date_str}**: {item.title}")
             if len(item.content) > 100:
-                analysis += f"  *Summary*: {item.content[:200]}...\n"
-            analysis += f"  *Source*: [Link]({item.url})\n\n"
+                lines.append(f"  *Summary*: {item.content[:200]}...")
+            lines.append(f"  *Source*: [Link]({item.url})")
+            lines.append("")
         
         # Top keywords for this company
-        all_keywords = []
-        for item in data_items:
-            if item.keywords:
-                all_keywords.extend(item.keywords)
+        keyword_freq = Counter(keyword for item in data_items if item.keywords for keyword in item.keywords)
         
-        if all_keywords:
-            keyword_freq = {}
-            for keyword in all_keywords:
-                keyword_freq[keyword] = keyword_freq.get(keyword, 0) + 1
-            
-            top_keywords = sorted(keyword_freq.items(), key=lambda x: x[1], reverse=True)[:8]
-            analysis += f"**Key Topics**: {', '.join([kw for kw, freq in top_keywords])}\n"
+        if keyword_freq:
+            top_keywords = keyword_freq.most_common(8)
+            lines.append(f"**Key Topics**: {', '.join([kw for kw, freq in top_keywords])}")
         
-        return analysis
+        return "\n".join(lines) + "\n"
     
     def _analyze_industry_trends(self, industry_data: List[MarketData]) -> str:
         """Analyze industry trends"""
-        analysis = f"**Industry Coverage**: {len(industry_data)} news items and updates tracked.\n\n"
+        lines = [f"**Industry Coverage**: {len(industry_data)} news items and updates tracked.", ""]
         
         # Top sources
-        source_count = {}
-        for item in industry_data:
-            source = item.source
-            source_count[source] = source_count.get(source, 0) + 1
+        source_count = Counter(item.source for item in industry_data)
         
-        top_sources = sorted(source_count.items(), key=lambda x: x[1], reverse=True)[:5]
-        analysis += "**Top News Sources:**\n"
+        top_sources = source_count.most_common(5)
+        lines.append("**Top News Sources:**")
         for source, count in top_sources:
-            analysis += f"- {source}: {count} articles\n"
-        analysis += "\n"
+            lines.append(f"- {source}: {count} articles")
+        lines.append("")
         
         # Recent headlines
-        recent_items = sorted(industry_data, key=lambda x: x.timestamp, reverse=True)[:8]
-        analysis += "**Recent Industry Headlines:**\n"
+        recent_items = heapq.nlargest(8, industry_data, key=attrgetter('timestamp'))
+        lines.append("**Recent Industry Headlines:**")
         for item in recent_items:
             date_str = item.timestamp.strftime('%m-%d')
-            analysis += f"- **{date_str}**: {item.title}\n"
+            lines.append(f"- **{date_str}**: {item.title}")
             if item.url:
-                analysis += f"  [Read more]({item.url})\n"
+                lines.append(f"  [Read more]({item.url})")
         
-        return analysis
+        return "\n".join(lines) + "\n"
     
-    def _analyze_keywords(self, data_list: List[MarketData]) -> str:
+    def _analyze_keywords(self, top_keywords: List[Tuple[str, int]]) -> str:
         """Analyze top keywords across all data"""
-        all_keywords = []
-        for item in data_list:
-            if item.keywords:
-                all_keywords.extend(item.keywords)
-        
-        if not all_keywords:
+        if not top_keywords:
             return "No keyword data available."
         
-        keyword_freq = {}
-        for keyword in all_keywords:
-            keyword_freq[keyword] = keyword_freq.get(keyword, 0) + 1
-        
-        top_keywords = sorted(keyword_freq.items(), key=lambda x: x[1], reverse=True)[:15]
-        
-        analysis = "**Most Mentioned Topics:**\n"
+        lines = ["**Most Mentioned Topics:**"]
         for keyword, freq in top_keywords:
-            analysis += f"- **{keyword}**: mentioned {freq} times\n"
+            lines.append(f"- **{keyword}**: mentioned {freq} times")
         
-        return analysis
+        return "\n".join(lines) + "\n"
 
 class MarketResearchAgent:
     """Main agent orchestrating the market research process"""
@@ -608,12 +1098,26 @@ class MarketResearchAgent:
         self.db_manager = DatabaseManager()
         self.report_generator = SimpleReportGenerator()
         self.news_aggregator = NewsAggregator(self.config.get('news_api_key'))
+        # HTTP session kept open across collection cycles while monitoring
+        self._session = None
+        # Recently fetched bodies are reused instead of re-downloaded (capped per source by its frequency)
+        self.page_cache = CacheStore()
+        self.scrape_ttl = self.config.get('scrape_ttl_hours', 6) * 3600
+        self.page_cache.prune(self.scrape_ttl)
+        self.send_email_reports = self.config.get('send_email_reports', False)
+        # SMTP connection reused across reports, opened on the first send
+        self._smtp = None
+        # Consecutive failures and monotonic next retry time of each failing source
+        self._source_state = {}
+        # Monitoring-mode source queue state: URLs waiting or in flight
+        self._queued_urls = set()
+        self._source_done = None
+        self._stopping = None
     
     def _load_config(self, config_path: str) -> Dict:
         """Load configuration from JSON file"""
         try:
-            with open(config_path, 'r') as f:
-                return json.load(f)
+            return _json_loads(Path(config_path).read_bytes())
         except FileNotFoundError:
             logger.warning(f"Config file {config_path} not found. Using default configuration.")
             return {
@@ -623,69 +1127,174 @@ class MarketResearchAgent:
     
     def setup_monitoring(self):
         """Set up data sources for monitoring"""
-        # Example data sources - customize as needed
+        # Sources listed under monitoring_sources in config.json
         sources = [
-            DataSource("https://techcrunch.com/feed/", "rss", "TechCrunch", 12),
-            DataSource("https://www.theverge.com/rss/index.xml", "rss", "TheVerge", 12),
-            DataSource("https://feeds.feedburner.com/venturebeat/SZYF", "rss", "VentureBeat", 12),
-            # Add your competitor websites here
-            # DataSource("https://competitor1.com", "website", "Competitor1", 24),
-            # DataSource("https://competitor2.com/news", "rss", "Competitor2", 12),
+            DataSource(entry['url'], entry['type'], entry['company'], entry.get('frequency', 24))
+            for entry in self.config.get('monitoring_sources', [])
         ]
         
+        if not sources:
+            # Example data sources - customize as needed
+            sources = [
+                DataSource("https://techcrunch.com/feed/", "rss", "TechCrunch", 12),
+                DataSource("https://www.theverge.com/rss/index.xml", "rss", "TheVerge", 12),
+                DataSource("https://feeds.feedburner.com/venturebeat/SZYF", "rss", "VentureBeat", 12),
+            ]
+        
         for source in sources:
             self.db_manager.add_data_source(source)
         
         logger.info(f"Set up {len(sources)} monitoring sources")
     
+    def _scraper(self) -> WebScraper:
+        """Create a scraper sharing the agent's session, page cache and stored IDs"""
+        return WebScraper(self._session, self.page_cache, self.scrape_ttl, self.db_manager.seen_ids)
+    
+    async def _fetch_source(self, scraper: WebScraper, source: DataSource,
+                            semaphore: asyncio.Semaphore) -> Optional[List[MarketData]]:
+        """Scrape and store a single data source, returning None if it wasn't checked"""
+        async with semaphore:
+            try:
+                logger.info(f"Processing {source.source_type} source: {source.url}")
+                
+                if source.source_type == "website":
+                    data = await scraper.scrape_website(source.url, source.company, source)
+                elif source.source_type == "rss":
+                    data = await scraper.scrape_rss_feed(source.url, source.company, source)
+                else:
+                    raise ValueError(f"Unsupported source type {source.source_type!r}")
+                
+                # Store data
+                self.db_manager.store_market_data_bulk(data)
+                
+                # Last checked timestamp is persisted in bulk by the caller
+                source.last_checked = datetime.now()
+                
+                logger.info(f"Collected {len(data)} items from {source.url}")
+                self._source_state.pop(source.url, None)
+                return data
+                
+            except Exception as e:
+                logger.error(f"Error processing source {source.url}: {e}")
+                self._record_source_failure(source.url)
+                return None
+    
+    def _record_source_failure(self, url: str):
+        """Back off exponentially from a source that keeps failing"""
+        state = self._source_state.setdefault(url, {'fails': 0, 'next_try': 0.0})
+        state['fails'] += 1
+        delay = min(MAX_SOURCE_BACKOFF, 30 * 2 ** (state['fails'] - 1))
+        state['next_try'] = time.monotonic() + delay
+        logger.info(f"Backing off {url} for {delay}s after {state['fails']} failed attempts")
+    
+    def _backoff_remaining(self, url: str) -> float:
+        """Seconds until a failing source may be tried again, or 0"""
+        state = self._source_state.get(url)
+        if state is None:
+            return 0.0
+        return max(0.0, state['next_try'] - time.monotonic())
+    
     async def collect_data(self):
         """Collect data from all configured sources"""
-        sources = self.db_manager.get_sources_to_check()
+        sources = [
+            source for source in self.db_manager.get_sources_to_check()
+            if not self._backoff_remaining(source.url)
+        ]
         logger.info(f"Checking {len(sources)} data sources")
         
         all_data = []
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
         
-        async with WebScraper() as scraper:
-            for source in sources:
-                try:
-                    logger.info(f"Processing {source.source_type} source: {source.url}")
-                    
-                    if source.source_type == "website":
-                        data = await scraper.scrape_website(source.url, source.company)
-                    elif source.source_type == "rss":
-                        data = await scraper.scrape_rss_feed(source.url, source.company)
-                    else:
-                        continue
-                    
-                    # Store data
-                    for item in data:
-                        self.db_manager.store_market_data(item)
-                        all_data.append(item)
-                    
-                    # Update last checked timestamp
-                    source.last_checked = datetime.now()
-                    self.db_manager.add_data_source(source)
-                    
-                    logger.info(f"Collected {len(data)} items from {source.url}")
-                    
-                except Exception as e:
-                    logger.error(f"Error processing source {source.url}: {e}")
-        
-        # Collect industry news
-        if self.config.get('industry_keywords'):
-            try:
-                logger.info("Collecting industry news...")
-                news_data = await self.news_aggregator.get_industry_news(self.config['industry_keywords'])
-                for item in news_data:
-                    self.db_manager.store_market_data(item)
-                    all_data.append(item)
-                logger.info(f"Collected {len(news_data)} industry news items")
-            except Exception as e:
-                logger.error(f"Error collecting industry news: {e}")
+        async with self._scraper() as scraper:
+            results = await asyncio.gather(
+                *(self._fetch_source(scraper, source, semaphore) for source in sources)
+            )
+            
+            checked_sources = []
+            for source, data in zip(sources, results):
+                if data is not None:
+                    checked_sources.append(source)
+                    all_data.extend(data)
+            
+            # Update last checked timestamps
+            self.db_manager.update_last_checked_bulk(checked_sources)
+            
+            all_data.extend(await self._collect_industry_news(scraper))
         
         logger.info(f"Total collected: {len(all_data)} new data points")
         return all_data
     
+    async def _collect_industry_news(self, scraper: WebScraper) -> List[MarketData]:
+        """Collect and store industry news for the configured keywords"""
+        if not self.config.get('industry_keywords'):
+            return []
+        
+        try:
+            logger.info("Collecting industry news...")
+            news_data = await self.news_aggregator.get_industry_news(
+                self.config['industry_keywords'], scraper
+            )
+            self.db_manager.store_market_data_bulk(news_data)
+            logger.info(f"Collected {len(news_data)} industry news items")
+            return news_data
+        except Exception as e:
+            logger.error(f"Error collecting industry news: {e}")
+            return []
+    
+    def _queue_due_sources(self, queue: asyncio.Queue) -> float:
+        """Queue every source that is due, returning the seconds until the next one will be"""
+        now = datetime.now()
+        # Re-read the sources at least hourly in case any were added
+        wait = 3600.0
+        
+        for source in self.db_manager.get_active_sources():
+            if source.url in self._queued_urls:
+                continue
+            
+            due_in = 0.0
+            if source.last_checked:
+                due_in = (source.last_checked + timedelta(hours=source.frequency) - now).total_seconds()
+            due_in = max(due_in, self._backoff_remaining(source.url))
+            
+            if due_in <= 0:
+                self._queued_urls.add(source.url)
+                queue.put_nowait(source)
+            else:
+                wait = min(wait, due_in)
+        
+        return wait
+    
+    async def _schedule_sources(self, queue: asyncio.Queue):
+        """Queue each source as its frequency comes due, sleeping until the next one is"""
+        while True:
+            wait = self._queue_due_sources(queue)
+            
+            # Finished sources change the next due time, so wake up early for them
+            try:
+                await asyncio.wait_for(self._source_done.wait(), timeout=wait)
+            except asyncio.TimeoutError:
+                pass
+            self._source_done.clear()
+    
+    async def _collection_worker(self, queue: asyncio.Queue, scraper: WebScraper,
+                                 semaphore: asyncio.Semaphore):
+        """Check queued sources one at a time, recording each as soon as it is done"""
+        while True:
+            source = await queue.get()
+            try:
+                data = await self._fetch_source(scraper, source, semaphore)
+                if data is not None:
+                    self.db_manager.update_last_checked_bulk([source])
+            finally:
+                self._queued_urls.discard(source.url)
+                queue.task_done()
+                self._source_done.set()
+    
+    async def run_news_cycle(self):
+        """Collect industry news on its own schedule"""
+        async with self._scraper() as scraper:
+            await self._collect_industry_news(scraper)
+    
     def generate_report(self) -> str:
         """Generate weekly market research report"""
         try:
@@ -696,23 +1305,13 @@ class MarketResearchAgent:
                 return None
             
             logger.info(f"Generating report from {len(recent_data)} data points")
-            report = self.report_generator.generate_weekly_report(recent_data)
+            top_keywords = self.db_manager.top_keywords(7, 15)
+            report = self.report_generator.generate_weekly_report(recent_data, top_keywords)
             
             # Store report in database
-            report_id = hashlib.md5(f"report_{datetime.now().isoformat()}".encode()).hexdigest()
+            report_id = hashlib.blake2b(f"report_{datetime.now().isoformat()}".encode(), digest_size=16).hexdigest()
             
-            conn = sqlite3.connect(self.db_manager.db_path, detect_types=sqlite3.PARSE_DECLTYPES)
-            cursor = conn.cursor()
-            cursor.execute('''
-                INSERT INTO reports (id, report_date, content, sources_cited, created_at)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (
-                report_id, datetime.now().strftime('%Y-%m-%d'),
-                report['content'], json.dumps(report['sources_cited']),
-                datetime.now()
-            ))
-            conn.commit()
-            conn.close()
+            self.db_manager.store_report(report_id, report)
             
             logger.info("Weekly report generated successfully")
             return report['content']
@@ -721,7 +1320,7 @@ class MarketResearchAgent:
             logger.error(f"Error generating report: {e}")
             return None
     
-    def send_email_report(self, report_content: str):
+    async def send_email_report(self, report_content: str):
         """Send report via email"""
         if not all([self.config.get('email_host'), self.config.get('email_user'), self.config.get('email_pass')]):
             logger.warning("Email configuration not complete. Skipping email send.")
@@ -735,72 +1334,214 @@ class MarketResearchAgent:
             
             msg.attach(MIMEText(report_content, 'plain'))
             
-            server = smtplib.SMTP(self.config['email_host'], self.config.get('email_port', 587))
-            server.starttls()
-            server.login(self.config['email_user'], self.config['email_pass'])
-            server.send_message(msg)
-            server.quit()
+            # smtplib is blocking, so talk to the server from a worker thread
+            await asyncio.get_running_loop().run_in_executor(None, self._deliver_email, msg)
             
             logger.info("Report sent via email successfully")
             
         except Exception as e:
             logger.error(f"Error sending email report: {e}")
     
+    def _smtp_connection(self) -> smtplib.SMTP:
+        """Get the logged-in SMTP connection, opening it on first use"""
+        if self._smtp is None:
+            server = smtplib.SMTP(self.config['email_host'], self.config.get('email_port', 587))
+            server.starttls()
+            server.login(self.config['email_user'], self.config['email_pass'])
+            self._smtp = server
+        return self._smtp
+    
+    def _deliver_email(self, msg: MIMEMultipart):
+        """Send a message through the configured SMTP server"""
+        try:
+            self._smtp_connection().send_message(msg)
+        except smtplib.SMTPServerDisconnected:
+            # The server dropped the idle connection; reconnect once and retry
+            self._smtp = None
+            self._smtp_connection().send_message(msg)
+    
+    def close_email(self):
+        """Close the SMTP connection if one is open"""
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except smtplib.SMTPException:
+                pass
+            self._smtp = None
+    
     async def run_collection_cycle(self):
         """Run a complete data collection cycle"""
         logger.info("Starting data collection cycle")
         await self.collect_data()
     
-    def run_report_generation(self):
+    async def run_report_generation(self):
         """Run report generation"""
         logger.info("Generating weekly report")
         report = self.generate_report()
         
         if report:
             # Save to file
-            report_path = f"reports/weekly_report_{datetime.now().strftime('%Y%m%d')}.md"
-            Path("reports").mkdir(exist_ok=True)
-            
-            with open(report_path, 'w', encoding='utf-8') as f:
-                f.write(report)
+            report_path = self._report_path(datetime.now())
+            # Write from a worker thread so scheduled fetches keep running meanwhile
+            await asyncio.get_running_loop().run_in_executor(None, self._write_report, report_path, report)
             
             logger.info(f"Report saved to {report_path}")
             
             # Send via email if configured
-            if self.config.get('send_email_reports', False):
-                self.send_email_report(report)
+            if self.send_email_reports:
+                await self.send_email_report(report)
+    
+    @staticmethod
+    def _report_path(now: datetime) -> str:
+        """Path of the report file for the day of now"""
+        return f"reports/weekly_report_{now.strftime('%Y%m%d')}.md"
+    
+    def _write_report(self, report_path: str, report: str):
+        """Save a report file, creating the reports folder if needed"""
+        path = Path(report_path)
+        path.parent.mkdir(exist_ok=True)
+        # Encode once and write the bytes directly, skipping the text-mode wrapper
+        path.write_bytes(report.encode('utf-8'))
+    
+    def _next_report_time(self, now: datetime) -> datetime:
+        """The first Monday at 9:00 AM after now"""
+        next_run = (now + timedelta(days=(7 - now.weekday()) % 7)).replace(hour=9, minute=0, second=0, microsecond=0)
+        if next_run <= now:
+            next_run += timedelta(days=7)
+        return next_run
+    
+    async def _run_periodically(self, interval: float, job):
+        """Run job every interval seconds, measured from fixed deadlines so slow runs don't add drift"""
+        next_run = time.monotonic() + interval
+        while True:
+            await asyncio.sleep(max(0, next_run - time.monotonic()))
+            
+            result = job()
+            if asyncio.iscoroutine(result):
+                await result
+            
+            # Skip any slots missed by an overlong run rather than running back to back
+            next_run += interval
+            while next_run <= time.monotonic():
+                next_run += interval
+    
+    async def _report_scheduler(self):
+        """Generate the weekly report every Monday at 9 AM"""
+        target = self._next_report_time(datetime.now())
+        while True:
+            # Sleep in bounded steps and re-check the wall clock, so a clock change (e.g. the end of
+            # daylight saving) can't fire the report early and then again at 9 AM
+            remaining = (target - datetime.now()).total_seconds()
+            if remaining > 0:
+                await asyncio.sleep(min(remaining, 3600))
+                continue
+            
+            await self.run_report_generation()
+            
+            # Advance from the target rather than from now, skipping any weeks missed while suspended
+            while target <= datetime.now():
+                target += timedelta(days=7)
     
-    def start_monitoring(self):
+    async def start_monitoring(self):
         """Start the autonomous monitoring process"""
         logger.info("Starting market research agent...")
         
-        # Run initial data collection
-        logger.info("Running initial data collection...")
-        asyncio.run(self.run_collection_cycle())
+        # Reuse pooled connections (DNS, TCP and TLS) across every cycle
+        self._session = WebScraper.create_session()
+        self._stopping = asyncio.Event()
         
-        # Generate initial report
-        logger.info("Generating initial report...")
-        self.run_report_generation()
+        loop = asyncio.get_running_loop()
+        handled_signals = []
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self._request_stop, sig)
+                handled_signals.append(sig)
+            except (NotImplementedError, RuntimeError):
+                # Not supported on Windows or off the main thread; Ctrl+C raises KeyboardInterrupt there
+                pass
         
-        # Schedule data collection every 6 hours
-        schedule.every(6).hours.do(lambda: asyncio.run(self.run_collection_cycle()))
+        try:
+            await self._monitor()
+        finally:
+            for sig in handled_signals:
+                loop.remove_signal_handler(sig)
+            await self._session.close()
+            self._session = None
+            self.close_email()
+            self.page_cache.close()
+            self.db_manager.close()
+            logger.info("Market research agent stopped")
+    
+    def _request_stop(self, sig: signal.Signals):
+        """Signal handler asking the monitoring loop to shut down"""
+        logger.info(f"Received {signal.Signals(sig).name}, shutting down...")
+        self._stopping.set()
+    
+    async def _monitor(self):
+        """Run the initial collection and report, then the recurring schedule until asked to stop"""
+        queue = asyncio.Queue()
+        self._source_done = asyncio.Event()
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+        
+        async with self._scraper() as scraper:
+            # The workers start on the initial collection straight away and keep running afterwards
+            logger.info("Running initial data collection...")
+            self._queue_due_sources(queue)
+            workers = [
+                asyncio.ensure_future(self._collection_worker(queue, scraper, semaphore))
+                for _ in range(COLLECTION_WORKERS)
+            ]
+            jobs = [asyncio.ensure_future(self._schedule_sources(queue))]
+            stop = asyncio.ensure_future(self._stopping.wait())
+            
+            try:
+                startup = asyncio.ensure_future(self._start_up(queue, scraper))
+                await asyncio.wait([startup, stop], return_when=asyncio.FIRST_COMPLETED)
+                
+                if stop.done():
+                    startup.cancel()
+                else:
+                    startup.result()
+                    
+                    # Each job sleeps until its next run is due
+                    jobs += [
+                        asyncio.ensure_future(self._run_periodically(6 * 3600, self.run_news_cycle)),
+                        asyncio.ensure_future(self._report_scheduler()),
+                        asyncio.ensure_future(self._run_periodically(15 * 60, self.db_manager.optimize))
+                    ]
+                    done, _ = await asyncio.wait([stop, *jobs, *workers], return_when=asyncio.FIRST_COMPLETED)
+                    
+                    # The jobs and workers only finish by failing
+                    for task in done:
+                        if task is not stop:
+                            task.result()
+                
+                # Stop queueing new work, but let sources already queued or in flight finish
+                for task in jobs:
+                    task.cancel()
+                try:
+                    await asyncio.wait_for(queue.join(), timeout=SHUTDOWN_TIMEOUT)
+                except asyncio.TimeoutError:
+                    logger.warning(f"Abandoning {len(self._queued_urls)} sources still being checked")
+            finally:
+                for task in (stop, *jobs, *workers):
+                    task.cancel()
+    
+    async def _start_up(self, queue: asyncio.Queue, scraper: WebScraper):
+        """Finish the initial collection, then generate the initial report"""
+        # Industry news is fetched alongside the sources rather than after them
+        await asyncio.gather(queue.join(), self._collect_industry_news(scraper))
         
-        # Schedule weekly report generation (every Monday at 9 AM)
-        schedule.every().monday.at("09:00").do(self.run_report_generation)
+        # Generate initial report
+        logger.info("Generating initial report...")
+        await self.run_report_generation()
         
         logger.info("Market research agent started. Press Ctrl+C to stop.")
         logger.info("Scheduled tasks:")
-        logger.info("- Data collection: Every 6 hours")
+        logger.info(f"- Data collection: Each source at its own frequency ({COLLECTION_WORKERS} workers)")
+        logger.info("- Industry news: Every 6 hours")
         logger.info("- Report generation: Every Monday at 9:00 AM")
-        
-        try:
-            while True:
-                logger.info("Checking for pending tasks...")
-                schedule.run_pending()
-                time.sleep(60)  # Check every minute
-                
-        except KeyboardInterrupt:
-            logger.info("Market research agent stopped")
+        logger.info("- Database optimize: Every 15 minutes")
 
 def create_sample_config():
     """Create a sample configuration file"""
@@ -834,8 +1575,11 @@ def create_sample_config():
         ]
     }
     
-    with open("config.json", "w") as f:
-        json.dump(config, f, indent=2)
+    if orjson is not None:
+        Path("config.json").write_bytes(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+    else:
+        with open("config.json", "w") as f:
+            json.dump(config, f, indent=2)
     
     print("Sample config.json created!")
     print("\nNext steps:")
@@ -863,13 +1607,16 @@ def run_test_collection():
         print("="*50)
         print(report[:500] + "..." if len(report) > 500 else report)
         print("\n" + "="*50)
-        print(f"Full report saved to: reports/weekly_report_{datetime.now().strftime('%Y%m%d')}.md")
+        print(f"Full report saved to: {MarketResearchAgent._report_path(datetime.now())}")
     else:
         print("No data collected yet. Try running again in a few hours.")
 
 if __name__ == "__main__":
     import sys
     
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    
     if len(sys.argv) > 1:
         if sys.argv[1] == "setup":
             create_sample_config()
@@ -887,7 +1634,8 @@ if __name__ == "__main__":
         elif sys.argv[1] == "report":
             # Manual report generation
             agent = MarketResearchAgent()
-            agent.run_report_generation()
+            asyncio.run(agent.run_report_generation())
+            agent.close_email()
             print("Report generation completed!")
             sys.exit(0)
     
@@ -898,4 +1646,8 @@ if __name__ == "__main__":
     agent.setup_monitoring()
     
     # Start autonomous monitoring
-    agent.start_monitoring()
\ No newline at end of file
+    try:
+        asyncio.run(agent.start_monitoring())
+    except KeyboardInterrupt:
+        # Only reached where signal handlers aren't supported; cleanup already ran as the task was cancelled
+        pass
\ No newline at end of file